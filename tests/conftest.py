@@ -4,19 +4,21 @@ Test configuration and fixtures for the FastAPI application.
 
 import pytest
 from fastapi.testclient import TestClient
-import sys
-import os
 
-# Add the src directory to the path so we can import the app
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+from src.app import app, activities
 
-from app import app, activities
+# Participants as loaded from the app, captured once for the session
+_BASELINE_PARTICIPANTS = {
+    name: tuple(data["participants"]) for name, data in activities.items()
+}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI application."""
-    return TestClient(app)
+    """Create a test client shared by the whole test session."""
+    # Entering the client keeps one event loop portal open for every request
+    with TestClient(app, follow_redirects=False) as test_client:
+        yield test_client
 
 
 @pytest.fixture
@@ -40,12 +42,10 @@ def sample_activities():
 
 @pytest.fixture
 def reset_activities():
-    """Reset activities to original state after each test."""
-    # Store original activities
-    original_activities = activities.copy()
-    
+    """Restore activity participants after a test that mutates them."""
     yield
-    
-    # Restore original activities
-    activities.clear()
-    activities.update(original_activities)
\ No newline at end of file
+
+    # Only participant lists are mutated by the endpoints, so write the
+    # baseline back into them in place
+    for name, participants in _BASELINE_PARTICIPANTS.items():
+        activities[name]["participants"][:] = participants